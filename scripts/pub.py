@@ -12,17 +12,38 @@ from teleai_zenoh_wrapper.pubsub import ZenohConfFactory
 from realsense import RealSenseCamera
 import zenoh
 
+# resize 的线程数：None 沿用 OpenCV 默认设置。
+# OpenCV 的 parallel_for_ 会把 INTER_AREA 按行切分到多核，但 960x540 -> 224x224 属于小图，
+# 线程调度开销可能抵消收益；请在目标机器上用 cv2.getTickCount 实测后再改为具体线程数
+# （单线程更快时设为 1）。
+RESIZE_THREADS: int | None = None
+
+# pub / sub 同机运行时置为 True：不经 zenohd 与 TCP loopback，改为以 peer 模式
+# 通过 unix socket 直连 sub 端（需与 sub.py 保持一致）。共享内存无需额外开启：
+# 默认配置已启用 SHM transport optimization，同机链路上超过 message_size_threshold 的帧会走共享内存
+LOCAL_SHM = False
+LOCAL_ENDPOINT = "unixsock-stream//tmp/teleai_zenoh_camera.sock"
+
 
 def main():
+    if RESIZE_THREADS is not None:
+        cv2.setNumThreads(RESIZE_THREADS)
+
     # ===== 1. Zenoh 连接配置（指向你的 zenohd） =====
     zenohd_endpoints = ["tcp/192.168.100.10:7447"]  # 按需改成你的 router 地址
 
-    conf_str = (
-        ZenohConfFactory.create_default()
-        .set_mode("client")
-        .set_connect_endpoints(zenohd_endpoints)
-        .to_str()
-    )
+    if LOCAL_SHM:
+        conf_str = (
+            ZenohConfFactory.create_default(listen_endpoints=[LOCAL_ENDPOINT])
+            .to_str()
+        )
+    else:
+        conf_str = (
+            ZenohConfFactory.create_default()
+            .set_mode("client")
+            .set_connect_endpoints(zenohd_endpoints)
+            .to_str()
+        )
 
     # 发布的 topic 与 testing_cameras.yaml 保持一致
     camera_topic = "cameras/realsense_L515"
@@ -56,26 +77,33 @@ def main():
     )
     print(f"    ZenohPub 创建成功，topic = {camera_topic}\n")
 
+    # 复用同一块 224x224x3 输出缓冲，避免 cv2.resize 每帧重新分配；
+    # pub.write() 在返回前已同步完成序列化拷贝，因此复用不存在别名问题
+    resized = np.empty((224, 224, 3), dtype=np.uint8)
+    last_color_ts = None
+
     try:
         while True:
             # RealSenseCamera.get_latest_frames() 返回：
             # (latest_color_image, latest_depth_image, latest_color_ts, latest_depth_ts)
             color_image, depth_image, color_ts, depth_ts = camera.get_latest_frames()
 
-            if color_image is None:
-                # 还没有拿到一帧图像，稍微等一会
+            if color_image is None or color_ts == last_color_ts:
+                # 还没有拿到新的一帧，稍微等一会；
+                # 不要空转重复发布同一帧，否则主线程会一直占着 GIL 拖慢采集线程
                 time.sleep(0.001)
                 continue
+            last_color_ts = color_ts
 
             # ===== 3. 压缩到 224x224x3 =====
-            resized = cv2.resize(color_image, (224, 224))
-            resized_u8 = resized.astype(np.uint8)
-            img_bytes = resized_u8.flatten().tobytes()
+            # >4x 降采样用 INTER_AREA：盒式滤波，画质更好且比默认 INTER_LINEAR 更快
+            cv2.resize(color_image, (224, 224), dst=resized, interpolation=cv2.INTER_AREA)
 
             # ===== 4. 打包成 ImagePacket224_224_3 并发布 =====
+            # 直接把 ndarray 交给 packet，to_bytes() 内部一次拷贝完成序列化
             pkt = ImagePacket224_224_3(
                 timestamp_ns=np.uint64(get_nano()),
-                img_buf=img_bytes,
+                img_buf=resized,
             )
             pub.write(pkt)
 
@@ -45,12 +45,20 @@ class RealSenseCamera:
         
         self.running = False
         self.thread = None
-        self.lock = threading.Lock()
 
-        self.latest_color_image = None
-        self.latest_depth_image = None
-        self.latest_color_ts = 0
-        self.latest_depth_ts = 0
+        # 最新一帧快照 (color, depth, color_ts, depth_ts)。
+        # 采集线程是唯一写者，整体替换该 tuple 引用在 GIL 下是原子的，读端无需加锁。
+        self._latest = (None, None, 0, 0)
+
+        # 三缓冲：采集线程轮流写入三块缓冲，刚发布给读端的那块
+        # 要再经过两帧才会被覆盖，读端也就不必再整帧 copy。
+        # 缓冲在收到第一帧时按实际 shape 分配（对齐后深度图分辨率会跟随彩色图）。
+        self._color_bufs = None
+        self._depth_bufs = None
+        # 与上面缓冲共享内存的一维视图，采集时直接按字节 copyto，无需每帧构造形状匹配的 ndarray
+        self._color_flat = None
+        self._depth_flat = None
+        self._write_idx = 0
 
     def start(self):
         self.pipeline = rs.pipeline()
@@ -84,6 +92,7 @@ class RealSenseCamera:
             raise
 
         self.running = True
+        self._update = self._make_update_fn()
         self.thread = threading.Thread(target=self._update, daemon=True)
         self.thread.start()
 
@@ -132,39 +141,111 @@ class RealSenseCamera:
             self.pipeline.stop()
             print("Camera stopped.")
 
-    def _update(self):
-        while self.running:
-            try:
-                frames = self.pipeline.wait_for_frames(timeout_ms=2000)
-            except RuntimeError:
-                continue
+    def _copy_color(self, color_frame):
+        """把彩色帧拷贝进当前写缓冲并返回该缓冲（首帧时按实际分辨率分配三缓冲）。"""
+        if self._color_bufs is None:
+            h, w = color_frame.get_height(), color_frame.get_width()
+            self._color_bufs = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(3)]
+            self._color_flat = [b.reshape(-1) for b in self._color_bufs]
+        np.copyto(self._color_flat[self._write_idx],
+                  np.frombuffer(color_frame.get_data(), dtype=np.uint8))
+        return self._color_bufs[self._write_idx]
 
-            if self.align:
-                frames = self.align.process(frames)
+    def _copy_depth(self, depth_frame):
+        """把深度帧拷贝进当前写缓冲并返回该缓冲（首帧时按实际分辨率分配三缓冲）。"""
+        if self._depth_bufs is None:
+            h, w = depth_frame.get_height(), depth_frame.get_width()
+            self._depth_bufs = [np.empty((h, w), dtype=np.uint16) for _ in range(3)]
+            self._depth_flat = [b.reshape(-1) for b in self._depth_bufs]
+        np.copyto(self._depth_flat[self._write_idx],
+                  np.frombuffer(depth_frame.get_data(), dtype=np.uint16))
+        return self._depth_bufs[self._write_idx]
 
-            color_frame = frames.get_color_frame() if self.enable_color else None
-            depth_frame = frames.get_depth_frame() if self.enable_depth else None
+    def _make_update_fn(self):
+        """
+        按 start() 时已确定的流配置生成专用的采集循环。
+        enable_color / enable_depth / align 在运行期不变，每个循环只保留帧有效性判断；
+        任一已启用的流缺帧时整组丢弃（写缓冲未发布，下轮直接覆盖）。
 
-            if (self.enable_color and not color_frame) or (self.enable_depth and not depth_frame):
-                continue
+        pyrealsense2 以 py::gil_scoped_release 包装 wait_for_frames，
+        阻塞等待期间不持有 GIL，不会卡住主线程的发布循环。
+        """
+        pipeline = self.pipeline
+        align = self.align
 
-            c_img = np.asanyarray(color_frame.get_data()) if color_frame else None
-            d_img = np.asanyarray(depth_frame.get_data()) if depth_frame else None
-            c_ts = color_frame.get_timestamp() if color_frame else 0
-            d_ts = depth_frame.get_timestamp() if depth_frame else 0
+        def _update_color_only():
+            while self.running:
+                try:
+                    frames = pipeline.wait_for_frames(timeout_ms=2000)
+                except RuntimeError:
+                    continue
+                color_frame = frames.get_color_frame()
+                if not color_frame:
+                    continue
+                c_buf = self._copy_color(color_frame)
+                # 单次引用赋值发布新帧，随后切换到下一块写缓冲
+                self._latest = (c_buf, None, color_frame.get_timestamp(), 0)
+                self._write_idx = (self._write_idx + 1) % 3
 
-            with self.lock:
-                if c_img is not None:
-                    self.latest_color_image = c_img.copy()
-                    self.latest_color_ts = c_ts
-                if d_img is not None:
-                    self.latest_depth_image = d_img.copy()
-                    self.latest_depth_ts = d_ts
+        def _update_depth_only():
+            while self.running:
+                try:
+                    frames = pipeline.wait_for_frames(timeout_ms=2000)
+                except RuntimeError:
+                    continue
+                depth_frame = frames.get_depth_frame()
+                if not depth_frame:
+                    continue
+                d_buf = self._copy_depth(depth_frame)
+                self._latest = (None, d_buf, 0, depth_frame.get_timestamp())
+                self._write_idx = (self._write_idx + 1) % 3
+
+        def _update_both_unaligned():
+            while self.running:
+                try:
+                    frames = pipeline.wait_for_frames(timeout_ms=2000)
+                except RuntimeError:
+                    continue
+                color_frame = frames.get_color_frame()
+                depth_frame = frames.get_depth_frame()
+                if not color_frame or not depth_frame:
+                    continue
+                c_buf = self._copy_color(color_frame)
+                d_buf = self._copy_depth(depth_frame)
+                self._latest = (c_buf, d_buf,
+                                color_frame.get_timestamp(), depth_frame.get_timestamp())
+                self._write_idx = (self._write_idx + 1) % 3
+
+        def _update_both_aligned():
+            while self.running:
+                try:
+                    frames = pipeline.wait_for_frames(timeout_ms=2000)
+                except RuntimeError:
+                    continue
+                frames = align.process(frames)
+                color_frame = frames.get_color_frame()
+                depth_frame = frames.get_depth_frame()
+                if not color_frame or not depth_frame:
+                    continue
+                c_buf = self._copy_color(color_frame)
+                d_buf = self._copy_depth(depth_frame)
+                self._latest = (c_buf, d_buf,
+                                color_frame.get_timestamp(), depth_frame.get_timestamp())
+                self._write_idx = (self._write_idx + 1) % 3
+
+        if self.enable_color and self.enable_depth:
+            return _update_both_aligned if align else _update_both_unaligned
+        if self.enable_depth:
+            return _update_depth_only
+        return _update_color_only
 
     def get_latest_frames(self):
-        with self.lock:
-            return (self.latest_color_image, self.latest_depth_image, 
-                    self.latest_color_ts, self.latest_depth_ts)
+        """
+        返回最新一帧 (color, depth, color_ts, depth_ts)。
+        返回的图像直接引用内部三缓冲，只读，且仅在随后两帧到达前保证不被覆盖；
+        需要长期持有时请自行 copy()。
+        """
+        return self._latest
 
 
 # --- 测试程序 ---
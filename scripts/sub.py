@@ -1,5 +1,3 @@
-import time
-
 import cv2
 import numpy as np
 
@@ -9,17 +7,33 @@ from teleai_zenoh_wrapper.pubsub import ZenohConfFactory
 
 import zenoh
 
+def _view(buf) -> np.ndarray:
+    """零拷贝地把 payload 视作 224x224x3 图像；长度已由 from_bytes 按 INFOSIZE 保证。"""
+    return np.frombuffer(buf, dtype=np.uint8).reshape(224, 224, 3)
+
+# 与 pub.py 同机运行时置为 True：以 peer 模式经 unix socket 直连 pub 端，
+# 同机链路上由默认启用的 SHM transport optimization 传输大帧
+LOCAL_SHM = False
+LOCAL_ENDPOINT = "unixsock-stream//tmp/teleai_zenoh_camera.sock"
+
 def main():
     # 与 pub 端保持一致的 router 地址和 topic
     zenohd_endpoints = ["tcp/192.168.100.10:7447"]  # 按需修改
     camera_topic = "cameras/realsense_L515"
 
-    conf_str = (
-        ZenohConfFactory.create_default()
-        .set_mode("client")
-        .set_connect_endpoints(zenohd_endpoints)
-        .to_str()
-    )
+    if LOCAL_SHM:
+        zenohd_endpoints = [LOCAL_ENDPOINT]
+        conf_str = (
+            ZenohConfFactory.create_default(connect_endpoints=zenohd_endpoints)
+            .to_str()
+        )
+    else:
+        conf_str = (
+            ZenohConfFactory.create_default()
+            .set_mode("client")
+            .set_connect_endpoints(zenohd_endpoints)
+            .to_str()
+        )
 
     print("=== Zenoh Sub 图像显示 ===")
     print(f"连接到 {zenohd_endpoints}, 订阅 topic = {camera_topic}")
@@ -33,24 +47,19 @@ def main():
     print("ZenohSub 创建成功，等待第一帧数据 ...")
     sub.wait_for_connection()
 
+    last_pkt = None
     try:
         while True:
+            # ZenohSub 只持有最新一帧：仅在收到新 packet 时刷新画面，
+            # 中间到达的旧帧自然被覆盖丢弃（latest-value 语义）
             pkt = sub.read()
-            if pkt is None:
-                time.sleep(0.01)
-                continue
-
-            # 将 bytes 还原成 224x224x3 的图像
-            img = np.frombuffer(pkt.img_buf, dtype=np.uint8)
-            if img.size != 224 * 224 * 3:
-                # 尺寸异常时跳过
-                time.sleep(0.01)
-                continue
-            img = img.reshape(224, 224, 3)
+            if pkt is not None and pkt is not last_pkt:
+                last_pkt = pkt
+                # 将 payload 还原成 224x224x3 的图像
+                cv2.imshow("L515 224x224 RGB", _view(pkt.img_buf))
 
-            cv2.imshow("L515 224x224 RGB", img)
-            # 30ms 刷新一次，按 q / Esc 退出
-            key = cv2.waitKey(30) & 0xFF
+            # waitKey(1) 只负责 GUI 事件泵送，不再阻塞 30ms 限制显示帧率；按 q / Esc 退出
+            key = cv2.waitKey(1) & 0xFF
             if key in (27, ord("q")):
                 break
 
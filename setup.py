@@ -43,6 +43,10 @@ setup(
             "paramiko>=3.5",
             "h5py>=3.12",
         ],
+        "fast": [
+            "orjson>=3.9",
+            "msgspec>=0.18",
+        ],
     },
 
     classifiers=[
@@ -8,13 +8,60 @@ import psutil
 from teleai_zenoh_wrapper.utils import logger
 
 
+_PROC_ROOT = "/proc"
+
+
+def _find_zenohd_in_proc() -> Optional[tuple[int, list[str]]]:
+    """
+    直接扫描 /proc 查找 zenohd 进程（仅 Linux）。
+
+    只读取每个进程很小的 comm 文件，仅对 comm 为 zenohd 的进程再读取 cmdline，
+    避免 psutil.process_iter 为每个进程读取 stat + cmdline。
+
+    返回:
+        (pid, cmdline) 或 None
+    """
+    for entry in os.listdir(_PROC_ROOT):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"{_PROC_ROOT}/{entry}/comm", "rb") as f:
+                if f.read().strip() != b"zenohd":
+                    continue
+            with open(f"{_PROC_ROOT}/{entry}/cmdline", "rb") as f:
+                raw = f.read()
+        except OSError:
+            continue
+        cmdline = [
+            arg.decode("utf-8", errors="replace")
+            for arg in raw.split(b"\0") if arg
+        ]
+        return int(entry), cmdline
+    return None
+
+
 def _get_running_zenohd_process() -> Optional[psutil.Process]:
     """
     查找正在运行的 zenohd 进程。
 
+    Linux 下走 /proc 快速路径，其余平台回退到 psutil.process_iter。
+    返回的 Process 与 process_iter 一致地带有 info 字典 (pid / name / cmdline)。
+
     返回:
         psutil.Process 或 None
     """
+    if os.path.isdir(_PROC_ROOT):
+        found = _find_zenohd_in_proc()
+        if found is None:
+            return None
+        pid, cmdline = found
+        try:
+            proc = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            return None
+        proc.info = {"pid": pid, "name": "zenohd", "cmdline": cmdline}
+        return proc
+
     for proc in psutil.process_iter(["pid", "name", "cmdline"]):
         try:
             name = proc.info.get("name") or ""
@@ -8,17 +8,27 @@ from abc import ABC, abstractmethod
 
 class InfoPacket(ABC):
     @abstractmethod
-    def to_bytes(self) -> bytes:
+    def to_bytes(self) -> bytes | bytearray:
         raise NotImplementedError
 
     @classmethod
     @abstractmethod
-    def from_bytes(cls, data: bytes) -> "InfoPacket":
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "InfoPacket":
         raise NotImplementedError
 
 
 _HEADER_FMT = "!Q"
-_HEADER_SIZE = struct.calcsize(_HEADER_FMT)
+_HEADER_STRUCT = struct.Struct(_HEADER_FMT)
+_HEADER_SIZE = _HEADER_STRUCT.size
+
+
+def _byte_view(data: bytes | bytearray | memoryview) -> memoryview:
+    """将输入统一为一维字节 memoryview（不拷贝）；非 C 连续的输入无法零拷贝切片，抛 ValueError。"""
+    mv = memoryview(data)
+    if not mv.c_contiguous:
+        raise ValueError("payload must be C-contiguous")
+    return mv.cast("B")
+
 
 # Header: timestamp_ns (uint64, 8 bytes) + str_len (uint32, 4 bytes)
 _STR_LEN_FMT = "!I"
@@ -46,17 +56,17 @@ class TimestampedStrPacket(InfoPacket):
 
     def to_bytes(self) -> bytes:
         encoded = self.text.encode("utf-8")
-        header = struct.pack(_HEADER_FMT, self.timestamp_ns)
+        header = _HEADER_STRUCT.pack(self.timestamp_ns)
         length = struct.pack(_STR_LEN_FMT, len(encoded))
         return header + length + encoded
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
         min_size = _HEADER_SIZE + _STR_LEN_SIZE
         if len(data) < min_size:
             raise ValueError(f"payload too small: {len(data)} < {min_size}")
 
-        timestamp_ns = np.frombuffer(data[:_HEADER_SIZE], dtype=np.uint64, count=1)[0]
+        timestamp_ns = np.uint64(_HEADER_STRUCT.unpack_from(data, 0)[0])
         (str_len,) = struct.unpack_from(_STR_LEN_FMT, data, _HEADER_SIZE)
 
         payload_start = _HEADER_SIZE + _STR_LEN_SIZE
@@ -66,7 +76,7 @@ class TimestampedStrPacket(InfoPacket):
                 f"payload truncated: expected {payload_end} bytes, got {len(data)}"
             )
 
-        text = data[payload_start:payload_end].decode("utf-8")
+        text = str(data[payload_start:payload_end], "utf-8")
         return cls(timestamp_ns=timestamp_ns, text=text)
 
 
@@ -77,9 +87,16 @@ class TimestampedBufPacket(InfoPacket):
     子类只需定义：
       - INFOSIZE: ClassVar[int]          payload 字节数
       - _BUF_FIELD: ClassVar[str]        payload 字段名 (默认 "buf")
+
+    _EXPECTED_SIZE (header + payload 总字节数) 与 _BUF_SLICE (payload 区间) 在子类定义时自动计算。
+
+    to_bytes() 返回新分配的 bytearray（可变、不可哈希），可直接交给 Zenoh put；
+    需要 bytes 语义（作字典键、长期保存防止被修改）时请自行 bytes(...)。
     """
     INFOSIZE: ClassVar[int]
     _BUF_FIELD: ClassVar[str] = "buf"
+    _EXPECTED_SIZE: ClassVar[int]
+    _BUF_SLICE: ClassVar[slice]
 
     timestamp_ns: np.uint64 = np.uint64(0)
 
@@ -107,24 +124,45 @@ class TimestampedBufPacket(InfoPacket):
                 f"but no field '{buf_field}' found in annotations"
             )
 
-    def _get_buf(self) -> bytes:
+        cls._EXPECTED_SIZE = _HEADER_SIZE + cls.INFOSIZE
+        cls._BUF_SLICE = slice(_HEADER_SIZE, cls._EXPECTED_SIZE)
+
+    def _get_buf(self) -> bytes | memoryview | np.ndarray:
         return getattr(self, self._BUF_FIELD)
 
-    def to_bytes(self) -> bytes:
-        raw = bytes(self._get_buf())
-        if len(raw) != self.INFOSIZE:
+    def _as_payload(self, size: int) -> memoryview:
+        """将 payload 字段统一为长度为 size 的连续 memoryview（不拷贝）。
+
+        支持 bytes / bytearray / memoryview / C 连续的 np.ndarray（按原始字节计，不限 dtype）。
+        """
+        raw = memoryview(self._get_buf())
+        if not raw.c_contiguous:
+            raise ValueError(f"{self._BUF_FIELD} must be C-contiguous")
+        if raw.nbytes != size:
             raise ValueError(
-                f"{self._BUF_FIELD} size must be {self.INFOSIZE}, got {len(raw)}"
+                f"{self._BUF_FIELD} size must be {size}, got {raw.nbytes}"
             )
-        return struct.pack(_HEADER_FMT, self.timestamp_ns) + raw
+        return raw
+
+    def to_bytes(self) -> bytearray:
+        # payload 直接拷贝进一块预分配的 bytearray，避免 bytes() 与 header 拼接产生的中间副本。
+        raw = self._as_payload(self.INFOSIZE)
+        out = bytearray(self._EXPECTED_SIZE)
+        _HEADER_STRUCT.pack_into(out, 0, self.timestamp_ns)
+        out[_HEADER_SIZE:] = raw
+        return out
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
-        expected = _HEADER_SIZE + cls.INFOSIZE
-        if len(data) < expected:
-            raise ValueError(f"payload too small: {len(data)} < {expected}")
-        timestamp_ns = np.frombuffer(data[:_HEADER_SIZE], dtype=np.uint64, count=1)[0]
-        buf = data[_HEADER_SIZE : _HEADER_SIZE + cls.INFOSIZE]
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
+        """payload 字段以 memoryview 形式引用 data，不做拷贝。
+
+        header 解析与 payload 切片均由 struct / memoryview 在 C 层完成，每包仅剩常数次 Python 调用。
+        """
+        mv = _byte_view(data)
+        if len(mv) < cls._EXPECTED_SIZE:
+            raise ValueError(f"payload too small: {len(mv)} < {cls._EXPECTED_SIZE}")
+        timestamp_ns = np.uint64(_HEADER_STRUCT.unpack_from(mv, 0)[0])
+        buf = mv[cls._BUF_SLICE]
         return cls(timestamp_ns=timestamp_ns, **{cls._BUF_FIELD: buf})
 
 @dataclass
@@ -152,17 +190,17 @@ class TimestampedBytesPacket(InfoPacket):
     data: bytes = b""
 
     def to_bytes(self) -> bytes:
-        header = struct.pack(_HEADER_FMT, self.timestamp_ns)
+        header = _HEADER_STRUCT.pack(self.timestamp_ns)
         length = struct.pack(_STR_LEN_FMT, len(self.data))
         return header + length + self.data
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
         min_size = _HEADER_SIZE + _STR_LEN_SIZE
         if len(data) < min_size:
             raise ValueError(f"payload too small: {len(data)} < {min_size}")
 
-        timestamp_ns = np.frombuffer(data[:_HEADER_SIZE], dtype=np.uint64, count=1)[0]
+        timestamp_ns = np.uint64(_HEADER_STRUCT.unpack_from(data, 0)[0])
         (byte_len,) = struct.unpack_from(_STR_LEN_FMT, data, _HEADER_SIZE)
 
         payload_start = _HEADER_SIZE + _STR_LEN_SIZE
@@ -172,5 +210,5 @@ class TimestampedBytesPacket(InfoPacket):
                 f"payload truncated: expected {payload_end} bytes, got {len(data)}"
             )
 
-        payload = data[payload_start:payload_end]
+        payload = bytes(data[payload_start:payload_end])
         return cls(timestamp_ns=timestamp_ns, data=payload)
\ No newline at end of file
@@ -1,12 +1,15 @@
 from typing import overload
 from typing_extensions import override
-from .base import InfoPacket, TimestampedBufPacket
+from .base import InfoPacket, TimestampedBufPacket, _HEADER_STRUCT, _HEADER_SIZE, _byte_view
 from typing import ClassVar
 
 from dataclasses import dataclass, field
 import struct
 import numpy as np
 
+# InferenceResultPacket 在公共 header (timestamp_ns) 之后的 body 头 (inference_start_nanosec, fps)
+_INFER_BODY = struct.Struct("!qi")
+
 def _make_image_packet(h: int, w: int, c: int):
     """
     Factory function to generate ImagePacket dataclass for specified resolution.
@@ -25,9 +28,8 @@ def _make_image_packet(h: int, w: int, c: int):
     class _Cls(TimestampedBufPacket):
         INFOSIZE: ClassVar[int] = size
         _BUF_FIELD: ClassVar[str] = "img_buf"
-        img_buf: bytes = field(
-            default_factory=lambda: np.zeros((h, w, c), dtype=np.uint8).tobytes()
-        )
+        # bytes 不可变，所有默认实例共享同一块全零 payload
+        img_buf: bytes | memoryview | np.ndarray = field(default=bytes(size))
 
     _Cls.__name__ = _Cls.__qualname__ = f"ImagePacket{h}_{w}_{c}"
     _Cls.__doc__ = f"{h}x{w}x{c} 图像 + 时间戳(ns)消息。"
@@ -47,12 +49,10 @@ def _make_infrence_result_packet(cs: int, dim: int, batchsize: int|None = None):
         Inference result dataclass(TimestampedBufPacket)
     """
     if batchsize is None:
-        shape = (cs, dim)
         elements = cs * dim
         name_suffix = f"{cs}_{dim}"
         doc_prefix = f"{cs}x{dim}"
     else:
-        shape = (batchsize, cs, dim)
         elements = batchsize * cs * dim
         name_suffix = f"{batchsize}_{cs}_{dim}"
         doc_prefix = f"{batchsize}x{cs}x{dim}"
@@ -61,29 +61,30 @@ def _make_infrence_result_packet(cs: int, dim: int, batchsize: int|None = None):
 
     @dataclass
     class _Cls(TimestampedBufPacket):
-        INFOSIZE: ClassVar[int] = size + 12
+        INFOSIZE: ClassVar[int] = size + _INFER_BODY.size
         _BUF_FIELD: ClassVar[str] = "inference_result_buf"
 
         inference_start_nanosec: int = 0
         fps: int = 0
-        inference_result_buf: bytes = field(
-            default_factory=lambda: np.zeros(shape, dtype=np.float32).tobytes()
-        )
+        inference_result_buf: bytes | memoryview | np.ndarray = field(default=bytes(size))
         
-        def to_bytes(self) -> bytes:
-            payload = struct.pack("!qi", self.inference_start_nanosec, self.fps) + self.inference_result_buf
-            if len(payload) != self.INFOSIZE:
-                raise ValueError(f"Payload size mismatch: {len(payload)} != {self.INFOSIZE}")
-            return struct.pack("!Q", self.timestamp_ns) + payload
+        def to_bytes(self) -> bytearray:
+            raw = self._as_payload(self.INFOSIZE - _INFER_BODY.size)
+            out = bytearray(self._EXPECTED_SIZE)
+            _HEADER_STRUCT.pack_into(out, 0, self.timestamp_ns)
+            _INFER_BODY.pack_into(out, _HEADER_SIZE, self.inference_start_nanosec, self.fps)
+            out[_HEADER_SIZE + _INFER_BODY.size:] = raw
+            return out
 
         @classmethod
-        def from_bytes(cls, data: bytes):
-            expected = 8 + cls.INFOSIZE
-            if len(data) < expected:
-                raise ValueError(f"payload too small: {len(data)} < {expected}")
-            timestamp_ns = np.frombuffer(data[:8], dtype=np.uint64, count=1)[0]
-            inference_start_nanosec, fps = struct.unpack("!qi", data[8:20])
-            buf = data[20 : expected]
+        def from_bytes(cls, data: bytes | bytearray | memoryview):
+            mv = _byte_view(data)
+            expected = cls._EXPECTED_SIZE
+            if len(mv) < expected:
+                raise ValueError(f"payload too small: {len(mv)} < {expected}")
+            timestamp_ns = np.uint64(_HEADER_STRUCT.unpack_from(mv, 0)[0])
+            inference_start_nanosec, fps = _INFER_BODY.unpack_from(mv, _HEADER_SIZE)
+            buf = mv[_HEADER_SIZE + _INFER_BODY.size : expected]
             return cls(timestamp_ns=timestamp_ns, inference_start_nanosec=inference_start_nanosec, fps=fps, inference_result_buf=buf)
 
     _Cls.__name__ = _Cls.__qualname__ = f"InferenceResultPacket{name_suffix}"
@@ -103,17 +104,13 @@ InferenceResultPacket3_20_16 = _make_infrence_result_packet(cs=20, dim=16, batch
 class U8Packet(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 1
     _BUF_FIELD: ClassVar[str] = "state_buf"
-    state_buf: bytes = field(
-        default_factory=lambda: np.zeros(1, dtype=np.uint8).tobytes()
-    )
+    state_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
 
 @dataclass
 class ControlPacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 10
     _BUF_FIELD: ClassVar[str] = "control_buf"
-    control_buf: bytes = field(
-        default_factory=lambda: np.zeros(10, dtype=np.uint8).tobytes()
-    )
+    control_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
     
     def to_dict(self) -> dict:
         return {
@@ -129,38 +126,28 @@ class ControlPacket(TimestampedBufPacket):
 class RoboticArmPacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 32
     _BUF_FIELD: ClassVar[str] = "RoboticArm_buf"
-    RoboticArm_buf: bytes = field(
-        default_factory=lambda: np.zeros(8, dtype=np.float32).tobytes()
-    )
+    RoboticArm_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
 
 @dataclass
 class SingleEEFPosePacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 32
     _BUF_FIELD: ClassVar[str] = "Pose_buf"
-    Pose_buf: bytes = field(
-        default_factory=lambda: np.zeros(8, dtype=np.float32).tobytes()
-    )
+    Pose_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
 
 @dataclass
 class DualEEFPosePacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 64
     _BUF_FIELD: ClassVar[str] = "Pose_buf"
-    Pose_buf: bytes = field(
-        default_factory=lambda: np.zeros(16, dtype=np.float32).tobytes()
-    )
+    Pose_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
 
 @dataclass
 class GALAXEARobotPacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 80
     _BUF_FIELD: ClassVar[str] = "GALAXEA_buf"
-    GALAXEA_buf: bytes = field(
-        default_factory=lambda: np.zeros(20, dtype=np.float32).tobytes() + np.zeros(1, dtype=np.uint8).tobytes()
-    )
+    GALAXEA_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
 
 @dataclass
 class ARXRobotPacket(TimestampedBufPacket):
     INFOSIZE: ClassVar[int] = 56
     _BUF_FIELD: ClassVar[str] = "ARX_buf"
-    ARX_buf: bytes = field(
-        default_factory=lambda: np.zeros(14, dtype=np.float32).tobytes()
-    )
\ No newline at end of file
+    ARX_buf: bytes | memoryview | np.ndarray = field(default=bytes(INFOSIZE))
\ No newline at end of file
@@ -1,9 +1,16 @@
-from dataclasses import dataclass, field
+from dataclasses import astuple, dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    # orjson 为可选依赖 (pip install teleai-zenoh-wrapper[fast])，缺省回退到标准库 json
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class QueueSize:
     """Zenoh 传输队列大小配置"""
     control: int = 2
@@ -28,7 +35,24 @@ class QueueSize:
         }
 
 
-@dataclass
+# set_queue_size 的字段校验集合，定义时计算一次
+QueueSize._FIELDS = frozenset(QueueSize.__dataclass_fields__)
+
+
+@dataclass(slots=True)
+class Batching:
+    """Zenoh 发送队列批处理配置 (time_limit 单位: ms)"""
+    enabled: bool = True
+    time_limit: int = 1
+
+    def to_dict(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "time_limit": self.time_limit,
+        }
+
+
+@dataclass(slots=True)
 class SharedMemory:
     """Zenoh 共享内存配置"""
     enabled: bool = True
@@ -49,7 +73,7 @@ class SharedMemory:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Timestamping:
     """Zenoh 时间戳配置"""
     enabled: bool = True
@@ -62,7 +86,7 @@ class Timestamping:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ZenohConfFactory:
     """
     Zenoh 配置工厂，通过链式调用灵活构建 pub / sub 配置。
@@ -83,6 +107,7 @@ class ZenohConfFactory:
     connect_endpoints: List[str] = field(default_factory=list)
     timestamping: Timestamping = field(default_factory=Timestamping)
     queue_size: QueueSize = field(default_factory=QueueSize)
+    batching: Batching = field(default_factory=Batching)
     shared_memory: SharedMemory = field(default_factory=SharedMemory)
 
     # ────────────────── 工厂方法 ──────────────────
@@ -132,12 +157,27 @@ class ZenohConfFactory:
         >>> .set_queue_size(real_time=8, data_high=16)
         """
         for k, v in kwargs.items():
-            if not hasattr(self.queue_size, k):
+            if k not in QueueSize._FIELDS:
                 raise ValueError(f"QueueSize 没有字段 '{k}'，"
                                  f"可选: {list(self.queue_size.__dataclass_fields__)}")
             setattr(self.queue_size, k, v)
         return self
 
+    def set_batching(
+        self,
+        enabled: Optional[bool] = None,
+        time_limit: Optional[int] = None,
+    ) -> "ZenohConfFactory":
+        """
+        配置发送队列批处理。仅对 express=False 的 publisher 生效，
+        多个小消息 / 多 topic 会在 time_limit(ms) 内合并为一次网络写入。
+        """
+        if enabled is not None:
+            self.batching.enabled = enabled
+        if time_limit is not None:
+            self.batching.time_limit = time_limit
+        return self
+
     def set_shared_memory(
         self,
         enabled: Optional[bool] = None,
@@ -176,6 +216,7 @@ class ZenohConfFactory:
                 "tx": {
                     "queue": {
                         "size": self.queue_size.to_dict(),
+                        "batching": self.batching.to_dict(),
                     }
                 }
             },
@@ -184,9 +225,42 @@ class ZenohConfFactory:
 
         return conf
 
+    def _cache_key(self) -> tuple:
+        """由全部配置字段组成的不可变 key，字段相同的工厂输出相同的 JSON。"""
+        return (
+            self.mode,
+            tuple(self.listen_endpoints),
+            tuple(self.connect_endpoints),
+            astuple(self.timestamping),
+            astuple(self.queue_size),
+            astuple(self.batching),
+            astuple(self.shared_memory),
+        )
+
     def to_str(self, indent: int = 2) -> str:
-        """输出 JSON 字符串，可直接传给 zenoh.Config.from_json5()"""
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        """输出 JSON 字符串，可直接传给 zenoh.Config.from_json5()
+
+        相同配置的重复调用直接命中缓存，不再重建 dict 与重新序列化。
+        """
+        return _render_conf(self._cache_key(), indent)
+
+
+@lru_cache(maxsize=64)
+def _render_conf(key: tuple, indent: int) -> str:
+    mode, listen, connect, timestamping, queue_size, batching, shared_memory = key
+    conf = ZenohConfFactory(
+        mode=mode,
+        listen_endpoints=list(listen),
+        connect_endpoints=list(connect),
+        timestamping=Timestamping(*timestamping),
+        queue_size=QueueSize(*queue_size),
+        batching=Batching(*batching),
+        shared_memory=SharedMemory(*shared_memory),
+    )
+    if orjson is not None and indent == 2:
+        # orjson 仅支持 2 空格缩进；输出 UTF-8，与 ensure_ascii=False 等价
+        return orjson.dumps(conf.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(conf.to_dict(), indent=indent, ensure_ascii=False)
 
 
 # ────────────────── 测试 ──────────────────
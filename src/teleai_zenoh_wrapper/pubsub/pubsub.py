@@ -1,16 +1,27 @@
 import zenoh
-from threading import Thread, Lock
+from threading import Thread, Event
 from teleai_zenoh_wrapper.infoclasses.base import InfoPacket, TimestampedBufPacket, TimestampedStrPacket
 from teleai_zenoh_wrapper.pubsub.conf import ZenohConfFactory
 from typing import Type
 import time
 from collections import deque
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _parse_conf(text: str) -> zenoh.Config:
+    """按 JSON 文本缓存解析后的 zenoh.Config。
+
+    zenoh.open() 按值接收 Config（绑定层拷贝一份），缓存的对象不会被会话修改，可安全复用。
+    """
+    return zenoh.Config.from_json5(text)
 
 
 class ZenohPub():
     def __init__(self, data_cls: Type[TimestampedBufPacket] | Type[TimestampedStrPacket],
             key: str | None = None,
-            session: zenoh.Session | None = None) -> None:
+            session: zenoh.Session | None = None,
+            express: bool = True) -> None:
         assert key is not None, "必须提供必要的key以供连接。"
         self._key = key
         self._data_cls = data_cls
@@ -18,7 +29,7 @@ class ZenohPub():
 
         self._session = session
         if not self._session:
-            self._session = zenoh.open(zenoh.Config.from_json5(
+            self._session = zenoh.open(_parse_conf(
                         ZenohConfFactory.create_default().to_str())
                 )
             
@@ -26,10 +37,18 @@ class ZenohPub():
             self._key,
             priority=zenoh.Priority.REAL_TIME,
             congestion_control=zenoh.CongestionControl.DROP,
-            express=True,
+            express=express,
         )
 
     def write(self, payload: TimestampedBufPacket|bytes):
+        """
+        发布一条消息。
+
+        express=True (默认) 时每条消息立即单独发送，延迟最低；
+        express=False 时消息进入发送队列，按 ZenohConfFactory.set_batching()
+        的 time_limit 与同一连接上的其他消息合并发送，吞吐更高但会引入至多
+        time_limit 的额外延迟，适合多 topic 并发或高频小消息场景。
+        """
         if isinstance(payload, TimestampedBufPacket):
             self._pub.put(payload.to_bytes())
         else:
@@ -57,45 +76,98 @@ class ZenohPub():
 class ZenohSub():
     def __init__(self, data_cls: Type[TimestampedBufPacket] | Type[TimestampedStrPacket],
                  key: str | None = None,
-                 session: zenoh.Session | None = None) -> None:
+                 session: zenoh.Session | None = None,
+                 decode_thread: bool = False) -> None:
+        """
+        decode_thread=True 时 Zenoh 回调只把原始 payload 放入单槽邮箱（新消息覆盖未解码的旧消息），
+        由独立线程执行 from_bytes 并更新 read() 的结果，回调线程不再被解码阻塞；
+        积压时只解码最新一条，解码失败的消息记录日志后丢弃。
+        适合 from_bytes 较重（自定义校验、NumPy 处理）的 packet；
+        默认的零拷贝 from_bytes 下额外的线程切换反而增加延迟，默认 False 关闭。
+        """
         assert key is not None, "必须提供必要的key以供连接。"
         self._key = key
         self._data_cls = data_cls
         self._owns_session = session is None
-        self._lock = Lock()
-
+        # _info 的发布与读取都是单次引用赋值 / 读取，在 GIL 下原子，无需加锁
         self._info = None
 
+        # 收到第一条消息时置位，供 wait_for_connection 阻塞等待
+        self._ready = Event()
+
+        # 解码线程的单槽邮箱：与 ZenohQueueSub 相同，deque(maxlen=1) 的 append / popleft 各自原子，
+        # 新消息直接覆盖未解码的旧消息，内存占用有界；_wake 通知解码线程有新消息或需要退出
+        self._mailbox = deque(maxlen=1)
+        self._wake = Event()
+        self._closing = False
+        # 解码线程在 declare_subscriber 成功后才启动：open / declare 抛异常时不会遗留阻塞的线程；
+        # 启动前到达的消息留在邮箱中，线程启动后立即处理
+        self._worker = None
+        if decode_thread:
+            self._worker = Thread(target=self._decode_loop, name=f"ZenohSub[{key}]", daemon=True)
+
         self._session = session
         if not self._session:
-            self._session = zenoh.open(zenoh.Config.from_json5(
+            self._session = zenoh.open(_parse_conf(
                         ZenohConfFactory.create_default().to_str())
                 )
 
         self._sub = self._session.declare_subscriber(
             self._key,
-            self._listen
+            self._enqueue if self._worker is not None else self._listen
         )
+        if self._worker is not None:
+            self._worker.start()
 
     def _listen(self, sample: zenoh.Sample) -> None:
-        with self._lock:
-            raw: bytes = bytes(sample.payload)          # ZBytes -> bytes
-            pkt = self._data_cls.from_bytes(raw)
-            self._info = pkt
+        self._update(bytes(sample.payload))             # ZBytes -> bytes
+
+    def _enqueue(self, sample: zenoh.Sample) -> None:
+        self._mailbox.append(bytes(sample.payload))
+        self._wake.set()
+
+    def _decode_loop(self) -> None:
+        # 延迟导入：utils 在模块级导入 teleai_zenoh_wrapper，顶层导入会形成循环
+        from teleai_zenoh_wrapper.utils import logger
+
+        mailbox, wake = self._mailbox, self._wake
+        while True:
+            wake.wait()
+            # 先 clear 再取：取出之后到达的消息会重新置位，不会丢失唤醒
+            wake.clear()
+            if self._closing:
+                return
+            try:
+                raw = mailbox.popleft()
+            except IndexError:
+                continue
+            try:
+                self._update(raw)
+            except Exception:
+                # 坏包只丢弃该条，解码线程继续处理后续消息
+                logger.exception(f"[ZenohSub] 解码 {self._key} 的消息失败")
+
+    def _update(self, raw: bytes) -> None:
+        self._info = self._data_cls.from_bytes(raw)
+        if not self._ready.is_set():
+            self._ready.set()
 
     def read(self):
-        with self._lock:
-            return self._info
+        return self._info
 
-    def wait_for_connection(self):
-        while self._info is None:
-            time.sleep(0.1)
+    def wait_for_connection(self, timeout: float | None = None) -> bool:
+        """阻塞直到收到第一条消息；返回 False 表示 timeout 秒内未收到。"""
+        return self._ready.wait(timeout)
 
     def close(self):
         try:
             self._sub.undeclare()
         except Exception:
             pass
+        if self._worker is not None:
+            self._closing = True
+            self._wake.set()
+            self._worker.join(timeout=1.0)
         try:
             if self._owns_session:
                 self._session.close()
@@ -119,12 +191,16 @@ class ZenohQueueSub():
                 
         self._key = key
         self._data_cls = data_cls
-        self._lock = Lock()
 
+        # 单槽邮箱：deque 的 append / popleft 由 C 实现且各自原子，读写两端都无需加锁；
+        # maxlen=1 时新消息直接覆盖未读的旧消息
         self._q = deque(maxlen=1)
+        # 收到第一条消息时置位，供 wait_for_connection 阻塞等待
+        self._ready = Event()
+
         self._session = session
         if not self._session:
-            self._session = zenoh.open(zenoh.Config.from_json5(
+            self._session = zenoh.open(_parse_conf(
                         ZenohConfFactory.create_default().to_str())
                 )
 
@@ -134,20 +210,20 @@ class ZenohQueueSub():
         )
 
     def _listen(self, sample: zenoh.Sample) -> None:
-        with self._lock:
-            raw: bytes = bytes(sample.payload)          # ZBytes -> bytes
-            pkt = self._data_cls.from_bytes(raw)
-            self._q.append(pkt)
+        raw: bytes = bytes(sample.payload)              # ZBytes -> bytes
+        self._q.append(self._data_cls.from_bytes(raw))
+        if not self._ready.is_set():
+            self._ready.set()
 
     def read(self):
-        with self._lock:
-            if self._q:
-                return self._q.popleft()
+        try:
+            return self._q.popleft()
+        except IndexError:
             return None
 
-    def wait_for_connection(self):
-        while not self._q:
-            time.sleep(0.1)
+    def wait_for_connection(self, timeout: float | None = None) -> bool:
+        """阻塞直到收到第一条消息；返回 False 表示 timeout 秒内未收到。"""
+        return self._ready.wait(timeout)
 
     def close(self):
         try:
@@ -176,13 +252,18 @@ class ZenohWildCardSub():
         
         self._key = key
         self._data_cls = data_cls
-        self._lock = Lock()
 
+        # 各子 topic 的最新 packet；收到第一条消息后 _info 才指向它，
+        # 保持 read() 在连接前返回 None 的语义。str key 的 dict 赋值在 GIL 下原子，无需加锁
+        self._frames = {}
         self._info = None
 
+        # 收到第一条消息时置位，供 wait_for_connection 阻塞等待
+        self._ready = Event()
+
         self._session = session
         if not self._session:
-            self._session = zenoh.open(zenoh.Config.from_json5(
+            self._session = zenoh.open(_parse_conf(
                         ZenohConfFactory.create_default().to_str())
                 )
 
@@ -192,21 +273,20 @@ class ZenohWildCardSub():
         )
 
     def _listen(self, sample: zenoh.Sample) -> None:
-        with self._lock:
-            key_expr = str(sample.key_expr)
-            raw: bytes = bytes(sample.payload)          # ZBytes -> bytes
-            pkt = self._data_cls.from_bytes(raw)
-            if not self._info:
-                self._info = {}
-            self._info[key_expr.split("/")[-1]] = pkt
+        key_expr = str(sample.key_expr)
+        raw: bytes = bytes(sample.payload)              # ZBytes -> bytes
+        pkt = self._data_cls.from_bytes(raw)
+        self._frames[key_expr.split("/")[-1]] = pkt
+        self._info = self._frames
+        if not self._ready.is_set():
+            self._ready.set()
 
     def read(self):
-        with self._lock:
-            return self._info
+        return self._info
 
-    def wait_for_connection(self):
-        while self._info is None:
-            time.sleep(0.1)
+    def wait_for_connection(self, timeout: float | None = None) -> bool:
+        """阻塞直到收到第一条消息；返回 False 表示 timeout 秒内未收到。"""
+        return self._ready.wait(timeout)
 
     def close(self):
         try:
@@ -249,8 +329,9 @@ def pub_p():
     num_messages = 5
     print(f"[3] 开始发布 {num_messages} 条测试消息 ...\n")
 
+    # payload 缓冲只分配一次；packet 直接接受 ndarray，to_bytes() 一次拷贝完成序列化
+    test_data = np.zeros((640, 480, 3), dtype=np.uint8)
     for i in range(num_messages):
-        test_data = np.zeros((640, 480, 3), dtype=np.uint8).tobytes()
         pkt = ImagePacket640_480_3(
             timestamp_ns=np.uint64(get_nano()),
             img_buf=test_data,
@@ -1,22 +1,97 @@
 import zenoh
 import json
+import operator
+import struct
 import time
 import signal
 import sys
 
 from typing import Callable
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺省回退到标准库 json
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # orjson 只支持 64 位以内的整数，超出时回退到标准库 json 以保留完整数值
+            return json.dumps(obj).encode("utf-8")
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# orjson.loads 会把超出 64 位的整数静默转成 float，解码不用 orjson（msgspec 可用时见下）
+_loads = json.loads
+
+try:
+    import msgspec
+except ImportError:  # msgspec 为可选依赖，缺省回退到通用 JSON 解码
+    msgspec = None
+
+if msgspec is not None:
+    class MathRequest(msgspec.Struct):
+        """rpc/math/* 请求体：只解码用到的 a / b，其余字段直接跳过"""
+        a: int | float = 0
+        b: int | float = 0
+
+    _math_request_decoder = msgspec.json.Decoder(MathRequest)
+    # msgspec 的无类型解码同样保留任意精度整数
+    _loads = msgspec.json.decode
+
+    def _decode_math_request(payload: bytes) -> tuple:
+        request = _math_request_decoder.decode(payload)
+        return request.a, request.b
+else:
+    def _decode_math_request(payload: bytes) -> tuple:
+        request = _loads(payload)
+        if not isinstance(request, dict):
+            raise ValueError(f"请求体必须是 JSON 对象，收到 {type(request).__name__}")
+        return request.get("a", 0), request.get("b", 0)
+
+# 二进制快速通道：请求为两个 int64（<qq，16 字节），回复为一个 int64（<q，8 字节），
+# 通过 APPLICATION_OCTET_STREAM 编码与 JSON 请求区分，未声明该编码的调用方仍走 JSON
+_MATH_REQUEST = struct.Struct("<qq")
+_MATH_REPLY = struct.Struct("<q")
+_BINARY_ENCODING = zenoh.Encoding.APPLICATION_OCTET_STREAM
+
+# rpc/math/<op> 的服务表：op -> (响应字段名, 运算)，服务端按 key 最后一段 O(1) 分发，
+# 二进制客户端据此还原响应字典的字段名；新增服务只需在此登记
+_HANDLERS: dict[str, tuple[str, Callable[[int | float, int | float], int | float]]] = {
+    "add": ("sum", operator.add),
+    "multiply": ("product", operator.mul),
+}
+
+def _unpack_math_reply(payload: bytes) -> int:
+    return _MATH_REPLY.unpack(payload)[0]
+
 def declare_queryable(session: zenoh.Session, key: str, handler: Callable[[zenoh.Query], None]):
     queryable = session.declare_queryable(key, handler)
     return queryable
 
-def call_queryable(session: zenoh.Session, key: str, payload: bytes):
-    replies = session.get(key, payload=payload)
-    
+def call_queryable(session: zenoh.Session, key: str, payload: bytes,
+                   timeout: float | None = None,
+                   encoding: zenoh.Encoding | None = None,
+                   decode: Callable[[bytes], object] = _loads):
+    """
+    返回第一条成功回复经 decode 解码后的结果，拿到即返回不再等待其余回复。
+
+    没有成功回复但收到了错误回复时抛出 RuntimeError（携带错误内容），
+    两者都没有（超时、无服务）时返回 None。
+    """
+    replies = session.get(key, payload=payload, encoding=encoding, timeout=timeout)
+    err = None
     for reply in replies:
         if reply.ok:
-            return json.loads(bytes(reply.ok.payload))
-        else:
-            pass
+            return decode(bytes(reply.ok.payload))
+        if err is None:
+            err = bytes(reply.err.payload)
+    if err is not None:
+        raise RuntimeError(f"RPC {key} 返回错误: {err.decode('utf-8', 'replace')}")
+    return None
 
 def server():
     conf = zenoh.Config.from_json5(r'''
@@ -32,26 +107,48 @@ def server():
     def on_query(query: zenoh.Query):
         """收到 RPC 请求时的回调"""
         key = str(query.selector)
-        payload_bytes = bytes(query.payload) if query.payload else b"{}"
-        request = json.loads(payload_bytes)
-
-        print(f"📥 收到请求 [{key}]: {request}")
-
-        # 业务逻辑：根据 key 路由到不同处理函数
-        if "add" in key:
-            result = {"sum": request.get("a", 0) + request.get("b", 0)}
-        elif "multiply" in key:
-            result = {"product": request.get("a", 0) * request.get("b", 0)}
+        payload_bytes = bytes(query.payload) if query.payload else b""
+        binary = query.encoding == _BINARY_ENCODING
+        if binary:
+            if len(payload_bytes) != _MATH_REQUEST.size:
+                query.reply_err(_dumps({
+                    "error": f"二进制请求应为 {_MATH_REQUEST.size} 字节，收到 {len(payload_bytes)}"
+                }))
+                return
+            a, b = _MATH_REQUEST.unpack(payload_bytes)
+        else:
+            try:
+                a, b = _decode_math_request(payload_bytes or b"{}")
+            except ValueError as e:
+                # msgspec.ValidationError / DecodeError 与 json.JSONDecodeError 均为 ValueError 子类
+                query.reply_err(_dumps({"error": f"请求解析失败: {e}"}))
+                return
+
+        print(f"📥 收到请求 [{key}]: a={a}, b={b}")
+
+        # 业务逻辑：根据 key 最后一段路由到不同处理函数（key_expr 不含 selector 参数）
+        handler = _HANDLERS.get(str(query.key_expr).rsplit("/", 1)[-1])
+        if handler is not None:
+            field_name, op = handler
+            result = {field_name: op(a, b)}
         else:
             result = {"error": f"未知服务: {key}"}
 
         print(f"📤 返回响应: {result}")
 
         # 回复请求
-        query.reply(
-            query.key_expr,
-            json.dumps(result).encode("utf-8"),
-        )
+        if not binary:
+            query.reply(query.key_expr, _dumps(result))
+        elif "error" in result:
+            query.reply_err(_dumps(result))
+        else:
+            (value,) = result.values()
+            try:
+                reply_bytes = _MATH_REPLY.pack(value)
+            except struct.error:
+                query.reply_err(_dumps({"error": f"结果超出 int64 范围: {value}"}))
+                return
+            query.reply(query.key_expr, reply_bytes, encoding=_BINARY_ENCODING)
 
     queryable = declare_queryable(session, "rpc/math/*", on_query)
     print("🚀 RPC 服务已启动，监听 rpc/math/*")
@@ -82,7 +179,8 @@ def client():
     time.sleep(0.5)  # 等待连接建立
 
     # ──── 调用 RPC ────
-    def rpc_call(service_key: str, params: dict, timeout_s: float = 5.0) -> dict:
+    def rpc_call(service_key: str, params: dict, timeout_s: float = 5.0,
+                 binary: bool = False) -> dict:
         """
         同步 RPC 调用。
 
@@ -90,20 +188,29 @@ def client():
             service_key: 服务路径，如 "rpc/math/add"
             params: 请求参数
             timeout_s: 超时秒数
+            binary: 以定长二进制（<qq / <q）代替 JSON 收发，仅适用于 int64 范围内的 a / b
 
         Returns:
             响应字典
 
         Raises:
             TimeoutError: 超时未收到响应
+            RuntimeError: 服务端返回错误回复（二进制模式下的未知服务、结果超出 int64 等）
         """
-        payload = json.dumps(params).encode("utf-8")
-
-        replies = call_queryable(session, service_key, payload)
-        if replies:
-            return replies
+        if binary:
+            payload = _MATH_REQUEST.pack(params["a"], params["b"])
+            value = call_queryable(session, service_key, payload, timeout=timeout_s,
+                                   encoding=_BINARY_ENCODING, decode=_unpack_math_reply)
+            result = None
+            if value is not None:
+                field_name, _ = _HANDLERS[service_key.rsplit("/", 1)[-1]]
+                result = {field_name: value}
         else:
+            payload = _dumps(params)
+            result = call_queryable(session, service_key, payload, timeout=timeout_s)
+        if result is None:
             raise TimeoutError(f"RPC 调用 {service_key} 超时 ({timeout_s}s)")
+        return result
 
     # ──── 测试调用 ────
     print("=== RPC 客户端测试 ===\n")
@@ -114,6 +221,9 @@ def client():
     result = rpc_call("rpc/math/multiply", {"a": 7, "b": 8})
     print(f"multiply(7, 8) = {result}")
 
+    result = rpc_call("rpc/math/add", {"a": 10, "b": 20}, binary=True)
+    print(f"add(10, 20) [binary] = {result}")
+
     session.close()
     print("\n=== 测试完成 ===")
 
@@ -56,6 +56,15 @@ class EndAwareLogger(logging.Logger):
         )
         self._zenoh_pubs[topic].write(pkt)
 
+    def makeRecord(self, *args, **kwargs):  # noqa: N802 (overrides logging.Logger)
+        # Give every record a concrete `end` attribute so the handler can read it
+        # directly. Set after `extra` is applied so caller values win.
+        record = super().makeRecord(*args, **kwargs)
+        d = record.__dict__
+        if "end" not in d:
+            d["end"] = "\n"
+        return record
+
     # Match stdlib signature but tolerate extra kwargs (like `end` and `topic`).
     def _log(
         self,
@@ -68,6 +77,19 @@ class EndAwareLogger(logging.Logger):
         stacklevel=1,
         **kwargs,
     ):
+        # Fast path: no `end` / `flush` / `topic` given (the common case),
+        # so there is nothing to extract and no need to copy `extra`.
+        if not kwargs:
+            return super()._log(
+                level,
+                msg,
+                args,
+                exc_info=exc_info,
+                extra=extra,
+                stack_info=stack_info,
+                stacklevel=stacklevel,
+            )
+
         _sentinel = object()
         end = kwargs.pop("end", _sentinel)
         flush = kwargs.pop("flush", _sentinel)
@@ -120,32 +142,82 @@ class EndAwareLogger(logging.Logger):
 class EndAwareStreamHandler(colorlog.StreamHandler):
     """StreamHandler that reads per-record `end` and uses it as terminator."""
 
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._needs_newline = False
+
     def emit(self, record):
-        # StreamHandler uses `self.terminator`; make it record-specific.
-        original_terminator = getattr(self, "terminator", "\n")
+        # Runs under `self.lock` (taken by Handler.handle). Write the record and its
+        # per-record terminator in one call instead of swapping `self.terminator`
+        # around StreamHandler.emit.
         try:
-            record_end = getattr(record, "end", original_terminator)
+            try:
+                # Set on every record by EndAwareLogger.makeRecord.
+                record_end = record.end
+            except AttributeError:
+                # Records propagated from plain child loggers lack it.
+                record_end = getattr(record, "end", self.terminator)
+
+            msg = self.format(record)
 
             # If the previous log used a non-newline terminator (progress-style output),
             # ensure the next *normal* log starts on a fresh line.
-            if getattr(self, "_needs_newline", False) and record_end == "\n":
-                try:
-                    self.stream.write("\n")
-                    self.flush()
-                except Exception:
-                    pass
-                self._needs_newline = False
+            if self._needs_newline and record_end == "\n":
+                msg = "\n" + msg
 
-            self.terminator = record_end
-            super().emit(record)
+            self.stream.write(msg + record_end)
+            # StreamHandler flushes after every record; `flush=True` is thus always honoured.
+            self.flush()
 
             # Track whether we're currently mid-line.
-            self._needs_newline = self.terminator != "\n"
+            self._needs_newline = record_end != "\n"
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LevelColorFormatter(logging.Formatter):
+    """只给 levelname 着色的固定格式 Formatter。
 
-            if getattr(record, "flush", False):
-                self.flush()
-        finally:
-            self.terminator = original_terminator
+    输出与原 colorlog 格式 "%(white)s[%(log_color)s%(levelname)s%(reset)s%(white)s] "
+    "[%(name)s] %(message)s%(reset)s" 一致；各级别的颜色前缀在构造时预先拼好，
+    每条记录只做一次字符串拼接，不再逐条解析格式串与颜色 token。
+
+    与 colorlog.ColoredFormatter 相同：设置了 FORCE_COLOR 时始终着色，
+    否则设置了 NO_COLOR 时输出不带转义码的纯文本（环境变量在构造时读取一次）。
+    """
+
+    _RESET = "\x1b[0m"
+    _WHITE = "\x1b[37m"
+    _LEVEL_COLORS = {
+        logging.DEBUG: "\x1b[36m",             # cyan
+        logging.INFO: "\x1b[32m",              # green
+        logging.WARNING: "\x1b[33m",           # yellow
+        logging.ERROR: "\x1b[31m",             # red
+        logging.CRITICAL: "\x1b[1;31m",         # bold_red
+    }
+
+    def __init__(self):
+        super().__init__()
+        colorize = "FORCE_COLOR" in os.environ or "NO_COLOR" not in os.environ
+        if colorize:
+            self._reset, self._white = self._RESET, self._WHITE
+            level_colors = self._LEVEL_COLORS
+        else:
+            self._reset = self._white = ""
+            level_colors = dict.fromkeys(self._LEVEL_COLORS, "")
+        self._level_prefix = {
+            levelno: f"{self._white}[{color}{logging.getLevelName(levelno)}"
+                     f"{self._reset}{self._white}] "
+            for levelno, color in level_colors.items()
+        }
+
+    def formatMessage(self, record):  # noqa: N802 (overrides logging.Formatter)
+        prefix = self._level_prefix.get(record.levelno)
+        if prefix is None:
+            prefix = f"{self._white}[{record.levelname}{self._reset}{self._white}] "
+        return f"{prefix}[{record.name}] {record.message}{self._reset}"
 
 
 def setup_logger():
@@ -162,21 +234,8 @@ def setup_logger():
             logger.removeHandler(h)
 
     handler = EndAwareStreamHandler(stream=sys.stdout)
-    handler.setFormatter(
-        colorlog.ColoredFormatter(
-            # Only colorize the level name; keep everything else base/white.
-            "%(white)s[%(log_color)s%(levelname)s%(reset)s%(white)s] "
-            "[%(name)s] %(message)s%(reset)s",
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "bold_red",
-            },
-            reset=True,
-        )
-    )
+    # Only colorize the level name; keep everything else base/white.
+    handler.setFormatter(_LevelColorFormatter())
     logger.addHandler(handler)
 
     logger.setLevel(logging.INFO)
@@ -193,13 +252,28 @@ class Timespec(ctypes.Structure):
         ("tv_nsec", ctypes.c_long)
     ]
 
-libc = ctypes.CDLL("libc.so.6")
+# CDLL(None) 复用进程中已加载的 libc（dlopen(NULL)），不再按文件名重新解析加载
+libc = ctypes.CDLL(None)
 nanosleep_func = libc.nanosleep
 
-def nano_sleep(ns):
-    req = Timespec(ns // 1_000_000_000, ns % 1_000_000_000)
-    rem = Timespec(0, 0)
-    nanosleep_func(ctypes.byref(req), ctypes.byref(rem))
+_sleep = time.sleep
+_clock_gettime_ns = time.clock_gettime_ns
+_CLOCK_REALTIME = time.CLOCK_REALTIME
+
+if sys.version_info >= (3, 11):
+    # 3.11+ 的 time.sleep 在 Linux 上直接调用 clock_nanosleep(CLOCK_MONOTONIC)，
+    # 纳秒精度且无需构造 ctypes 结构体。
+    # ns <= 0（如 period - elapsed 超时）时直接返回：time.sleep 对负数会抛 ValueError，
+    # 而 libc nanosleep 只是返回 EINVAL，两个分支保持一致
+    def nano_sleep(ns):
+        if ns > 0:
+            _sleep(ns / 1e9)
+else:
+    def nano_sleep(ns):
+        if ns <= 0:
+            return
+        req = Timespec(ns // 1_000_000_000, ns % 1_000_000_000)
+        nanosleep_func(ctypes.byref(req), None)
 
 def get_nano():
-    return time.clock_gettime_ns(time.CLOCK_REALTIME)
\ No newline at end of file
+    return _clock_gettime_ns(_CLOCK_REALTIME)
\ No newline at end of file
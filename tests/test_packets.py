@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from teleai_zenoh_wrapper.infoclasses import ImagePacket224_224_3, InferenceResultPacket20_8
+from teleai_zenoh_wrapper.infoclasses.base import TimestampedBytesPacket, TimestampedStrPacket
+
+# 高位与低位字节都非零，字节序解错时必然不相等
+TIMESTAMP_NS = np.uint64(0x0102030405060708)
+
+INPUT_KINDS = [bytes, bytearray, memoryview]
+
+
+def _wire(pkt, kind):
+    return kind(bytes(pkt.to_bytes()))
+
+
+@pytest.mark.parametrize("kind", INPUT_KINDS)
+def test_image_packet_round_trip(kind):
+    img = np.arange(224 * 224 * 3, dtype=np.uint64).astype(np.uint8).reshape(224, 224, 3)
+    pkt = ImagePacket224_224_3(timestamp_ns=TIMESTAMP_NS, img_buf=img)
+
+    restored = ImagePacket224_224_3.from_bytes(_wire(pkt, kind))
+
+    assert restored.timestamp_ns == TIMESTAMP_NS
+    assert isinstance(restored.img_buf, memoryview)
+    assert np.array_equal(np.frombuffer(restored.img_buf, dtype=np.uint8).reshape(img.shape), img)
+
+
+def test_image_packet_header_is_big_endian():
+    raw = ImagePacket224_224_3(timestamp_ns=TIMESTAMP_NS).to_bytes()
+
+    assert isinstance(raw, bytearray)
+    assert raw[:8] == bytes.fromhex("0102030405060708")
+
+
+@pytest.mark.parametrize("kind", INPUT_KINDS)
+def test_inference_result_packet_round_trip(kind):
+    result = np.linspace(-1.0, 1.0, 20 * 8, dtype=np.float32).reshape(20, 8)
+    pkt = InferenceResultPacket20_8(
+        timestamp_ns=TIMESTAMP_NS,
+        inference_start_nanosec=-123,
+        fps=30,
+        inference_result_buf=result,
+    )
+
+    restored = InferenceResultPacket20_8.from_bytes(_wire(pkt, kind))
+
+    assert restored.timestamp_ns == TIMESTAMP_NS
+    assert restored.inference_start_nanosec == -123
+    assert restored.fps == 30
+    decoded = np.frombuffer(restored.inference_result_buf, dtype=np.float32).reshape(result.shape)
+    assert np.array_equal(decoded, result)
+
+
+@pytest.mark.parametrize("kind", INPUT_KINDS)
+def test_str_packet_round_trip(kind):
+    pkt = TimestampedStrPacket(timestamp_ns=TIMESTAMP_NS, text="hello 你好")
+
+    restored = TimestampedStrPacket.from_bytes(_wire(pkt, kind))
+
+    assert restored.timestamp_ns == TIMESTAMP_NS
+    assert restored.text == "hello 你好"
+
+
+@pytest.mark.parametrize("kind", INPUT_KINDS)
+def test_bytes_packet_round_trip(kind):
+    pkt = TimestampedBytesPacket(timestamp_ns=TIMESTAMP_NS, data=b"\x00\x01\xfe\xff")
+
+    restored = TimestampedBytesPacket.from_bytes(_wire(pkt, kind))
+
+    assert restored.timestamp_ns == TIMESTAMP_NS
+    assert restored.data == b"\x00\x01\xfe\xff"
+
+
+@pytest.mark.parametrize(
+    "cls", [ImagePacket224_224_3, InferenceResultPacket20_8, TimestampedStrPacket,
+            TimestampedBytesPacket],
+)
+def test_from_bytes_rejects_short_payload(cls):
+    with pytest.raises(ValueError):
+        cls.from_bytes(b"\x00" * 4)
+
+
+@pytest.mark.parametrize("cls", [TimestampedStrPacket, TimestampedBytesPacket])
+def test_from_bytes_rejects_truncated_variable_payload(cls):
+    # 长度字段声明 16 字节，实际只有 3 字节
+    raw = bytes(8) + (16).to_bytes(4, "big") + b"abc"
+    with pytest.raises(ValueError):
+        cls.from_bytes(raw)
+
+
+def test_to_bytes_rejects_wrong_payload_size():
+    pkt = ImagePacket224_224_3(timestamp_ns=TIMESTAMP_NS, img_buf=b"\x00" * 10)
+    with pytest.raises(ValueError):
+        pkt.to_bytes()
+
+
+def test_to_bytes_rejects_non_contiguous_payload():
+    img = np.zeros((224, 448, 3), dtype=np.uint8)[:, ::2]
+    pkt = ImagePacket224_224_3(timestamp_ns=TIMESTAMP_NS, img_buf=img)
+    with pytest.raises(ValueError):
+        pkt.to_bytes()
+
+
+@pytest.mark.parametrize("cls", [ImagePacket224_224_3, InferenceResultPacket20_8])
+def test_from_bytes_rejects_non_contiguous_input(cls):
+    raw = np.zeros(cls._EXPECTED_SIZE * 2, dtype=np.uint8)[::2]
+    with pytest.raises(ValueError):
+        cls.from_bytes(memoryview(raw))